@@ -471,14 +471,18 @@ ORDER BY m.timestamp DESC
         .toList();
   }
 
-  /// 仍引用某附件路径的消息条数——转发会共享同一副本，0 才能安全删文件。
-  Future<int> countMessagesWithAttachment(String path) async {
-    final count = messageRows.id.count();
-    final row = await (selectOnly(messageRows)
-          ..addColumns([count])
-          ..where(messageRows.attachmentPath.equals(path)))
-        .getSingle();
-    return row.read(count) ?? 0;
+  /// [paths] 中仍被消息引用的那些——转发会共享同一副本，不在结果里的才能安全
+  /// 删文件。一次 `IN (...)` 查询取回，不逐路径 count。
+  Future<Set<String>> referencedAttachmentPaths(Set<String> paths) async {
+    if (paths.isEmpty) return const {};
+    final rows = await (selectOnly(messageRows, distinct: true)
+          ..addColumns([messageRows.attachmentPath])
+          ..where(messageRows.attachmentPath.isIn(paths)))
+        .get();
+    return rows
+        .map((r) => r.read(messageRows.attachmentPath))
+        .whereType<String>()
+        .toSet();
   }
 
   // ---- Memories ----
@@ -182,6 +182,10 @@ class AppState {
   Role? getRoleById(String id) =>
       roles.where((r) => r.id == id).firstOrNull;
 
+  /// id → 角色索引。[getRoleById] 是线性扫描，逐条消息/逐成员解析角色的循环
+  /// 应在循环外取一次本表再查，避免 O(消息数 × 角色数)。
+  Map<String, Role> get rolesById => {for (final r in roles) r.id: r};
+
   Group? getGroupById(String id) =>
       groups.where((g) => g.id == id).firstOrNull;
 
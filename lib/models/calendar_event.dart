@@ -1,3 +1,5 @@
+import '../utils/time_format.dart';
+
 /// 日历事件——local-first 数据模型，对应 drift `calendar_events` 表与服务端
 /// `calendar_events` 行的并集。
 ///
@@ -105,12 +107,12 @@ class CalendarEvent {
   String? get localTimeLabel {
     if (allDay) return null;
     final l = localStart;
-    return _hhmm(l);
+    return fmtHourMinute(l);
   }
 
   String? get localEndTimeLabel {
     if (allDay || endTime == null) return null;
-    return _hhmm(endTime!.toLocal());
+    return fmtHourMinute(endTime!.toLocal());
   }
 
   String? get reminderText {
@@ -120,9 +122,6 @@ class CalendarEvent {
     if (m >= 60) return '提前${m ~/ 60}小时';
     return '提前$m分钟';
   }
-
-  static String _hhmm(DateTime dt) =>
-      '${dt.hour.toString().padLeft(2, '0')}:${dt.minute.toString().padLeft(2, '0')}';
 }
 
 /// 创建日程时的入参：仅业务字段，无 id / 同步元数据——这些由 Repository 盖戳。
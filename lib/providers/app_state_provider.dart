@@ -85,6 +85,17 @@ class AppStateNotifier extends StateNotifier<AppState> {
   /// 启动放行兜底定时器——就绪或 dispose 时取消，避免悬挂。
   Timer? _readyWatchdog;
 
+  /// [_modelService] 的实例缓存及其组装参数。配置不变时复用同一实例（连同其
+  /// Dio 连接池），见 [_modelService]。
+  ModelService? _cachedModelService;
+  Object? _cachedModelServiceKey;
+
+  /// [translateText] 结果缓存，键 = (模型, 目标语言, 原文)。存的是 Future：并发
+  /// 重复点击也只打一次 LLM；失败即移除，下次重试。超出上限按插入顺序淘汰。
+  final _translationCache =
+      <(String, String, String), Future<LlmCardResult>>{};
+  static const _kTranslationCacheSize = 32;
+
   AppStateNotifier(this._ref)
       : super(const AppState(
           // 启动时为空——_loadState 里 await loadDefaultRoles() 后注入。
@@ -263,15 +274,17 @@ class AppStateNotifier extends StateNotifier<AppState> {
   // ---- Attachments & forwarding ----
 
   /// 发送附件消息（不触发 AI 回复——模型暂不消费文件内容，喂给 LLM 的多模态
-  /// 链路后续单独做）。[groupId] 非空 = 发到群聊。
+  /// 链路后续单独做）。[groupId] 非空 = 发到群聊。[size] 为选取器已报出的字节
+  /// 数，给了就直接用，省一次对副本的 stat；没给才读副本长度。
   Future<void> sendAttachment({
     required String type,
     required String sourcePath,
     required String name,
     String? groupId,
+    int? size,
   }) async {
     final copy = await AttachmentStore.import(sourcePath);
-    final size = await copy.length();
+    final attachmentSize = size ?? await copy.length();
     final msg = Message(
       id: _uuid.v4(),
       // 群聊的用户消息 roleId 为空串（与 MessagingController 的群发一致）。
@@ -283,7 +296,7 @@ class AppStateNotifier extends StateNotifier<AppState> {
       attachmentType: type,
       attachmentPath: copy.path,
       attachmentName: name,
-      attachmentSize: size,
+      attachmentSize: attachmentSize,
     );
     state = state.copyWith(messages: [...state.messages, msg]);
     _persistMessage(msg);
@@ -766,10 +779,11 @@ class AppStateNotifier extends StateNotifier<AppState> {
   /// 删完消息后清理私有附件副本：转发会共享同一路径，仅当库里再无引用才删文件。
   Future<void> _cleanupOrphanAttachments(
       PikppoDatabase db, List<String> paths) async {
-    for (final path in paths.toSet()) {
-      if (await db.countMessagesWithAttachment(path) == 0) {
-        await AttachmentStore.delete(path);
-      }
+    final candidates = paths.toSet();
+    if (candidates.isEmpty) return;
+    final referenced = await db.referencedAttachmentPaths(candidates);
+    for (final path in candidates.difference(referenced)) {
+      await AttachmentStore.delete(path);
     }
   }
 
@@ -837,12 +851,32 @@ class AppStateNotifier extends StateNotifier<AppState> {
   /// **一次性调用，不进对话历史**——供消息选择菜单"翻译"的弹窗用。
   /// 未配置模型时抛 [StateError]（调用方在弹窗里转成友好提示）。
   /// 翻译选中/整条文本——返回译文 + 推荐标签（供"保存到知识卡片"用）。
+  /// 同模型、同目标语言下同一段原文只翻一次，见 [_translationCache]。
   Future<LlmCardResult> translateText(String text) async {
     final service = modelService();
     if (service == null || state.currentModel.isEmpty) {
       throw StateError('未配置模型');
     }
+    final model = state.currentModel;
     final lang = state.preferredLanguage;
+    final key = (model, lang, text);
+    final cached = _translationCache[key];
+    if (cached != null) return cached;
+    if (_translationCache.length >= _kTranslationCacheSize) {
+      _translationCache.remove(_translationCache.keys.first);
+    }
+    final future = _requestTranslation(service, model, lang, text);
+    _translationCache[key] = future;
+    unawaited(future.then((_) {}, onError: (Object _) {
+      if (identical(_translationCache[key], future)) {
+        _translationCache.remove(key);
+      }
+    }));
+    return future;
+  }
+
+  Future<LlmCardResult> _requestTranslation(
+      ModelService service, String model, String lang, String text) async {
     final hint = await _tagReuseHint(text);
     final prompt = '把下面的文本翻译成$lang；如果它本身就是$lang，则翻译成英文。\n'
         '只输出 JSON，不要任何额外说明：{"text":"译文","tags":["主题/领域标签"]}\n'
@@ -851,7 +885,7 @@ class AppStateNotifier extends StateNotifier<AppState> {
         '\n原文：$text';
     final raw = await service.chat([
       {'role': 'user', 'content': prompt},
-    ], state.currentModel);
+    ], model);
     return _parseCardResult(raw);
   }
 
@@ -1105,18 +1139,30 @@ class AppStateNotifier extends StateNotifier<AppState> {
   /// `ref.read(modelServiceProvider)`，否则会跟 provider 内部 `watch` 本 notifier
   /// 的 state 构成循环依赖（Riverpod 抛 `CircularDependencyError`）。
   ///
-  /// `OllamaService` 跨实例的能力缓存通过 host 维度 static 表保活，不依赖
-  /// 实例复用。
+  /// 每次发消息、聊天页每次 build 都会调到这里。按组装参数缓存实例：参数不变
+  /// 就复用上一个 service——不必每次新建 Dio、丢掉已建立的 TLS 连接。参数任一
+  /// 变化（切厂商 / 改 host / 换 key）才重建。`OllamaService` 的能力缓存本就
+  /// 按 host 挂在 static 表上，与实例复用无关。
   ModelService? _modelService() {
     if (state.serviceType != 'cloud' && state.currentModel.isEmpty) {
       return null;
     }
-    return buildModelService(
+    final keys = _ref.read(cloudApiKeysProvider);
+    final cacheKey = (
+      state.serviceType,
+      state.serviceHost,
+      state.localProvider,
+      state.cloudProvider,
+      keys[state.cloudProvider],
+    );
+    if (cacheKey == _cachedModelServiceKey) return _cachedModelService;
+    _cachedModelServiceKey = cacheKey;
+    return _cachedModelService = buildModelService(
       type: state.serviceType,
       host: state.serviceHost,
       localProvider: state.localProvider,
       cloudProvider: state.cloudProvider,
-      cloudApiKeys: _ref.read(cloudApiKeysProvider),
+      cloudApiKeys: keys,
     );
   }
 
@@ -1243,20 +1289,22 @@ class AppStateNotifier extends StateNotifier<AppState> {
     String roleId, {
     String? groupSuffix,
   }) async {
-    final visible = state.memoriesForRole(roleId);
-    final profileMemories = visible
-        .where((m) => m.roleId == null && m.type == 'semantic')
-        .map((m) => m.content)
-        .toList();
-    final roleSemantic = visible
-        .where((m) => m.roleId == roleId && m.type == 'semantic')
-        .map((m) => m.content)
-        .toList();
-    final episodic = visible
-        .where((m) => m.roleId == roleId && m.type == 'episodic')
-        .take(5)
-        .map((m) => m.content)
-        .toList();
+    // 一趟分桶：共享画像 / 角色专属语义 / 角色近期事件（最多 5 条）。每次回复
+    // 都要组装，不为三类各扫一遍记忆表。
+    final profileMemories = <String>[];
+    final roleSemantic = <String>[];
+    final episodic = <String>[];
+    for (final m in state.memories) {
+      if (m.roleId == null) {
+        if (m.type == 'semantic') profileMemories.add(m.content);
+      } else if (m.roleId == roleId) {
+        if (m.type == 'semantic') {
+          roleSemantic.add(m.content);
+        } else if (m.type == 'episodic' && episodic.length < 5) {
+          episodic.add(m.content);
+        }
+      }
+    }
 
     final calendarContext = await _buildCalendarContext();
     // 实时系统信息放最前并强声明权威性，避免小模型用训练时的旧日期/坐标乱答。
@@ -5,6 +5,7 @@ import 'package:flutter_riverpod/flutter_riverpod.dart';
 import 'package:uuid/uuid.dart';
 import '../models/group.dart';
 import '../models/message.dart';
+import '../models/role.dart';
 import '../services/agent.dart';
 import '../services/mcp_service.dart';
 import '../services/model_service.dart';
@@ -220,6 +221,9 @@ class MessagingController {
     final history =
         recentChatHistory(source.where((m) => m.kind == 'chat').toList());
     final lastUserIdx = indexOfLastUser(history);
+    final rolesById = group == null
+        ? const <String, Role>{}
+        : _notifier.currentState.rolesById;
     return [
       for (var i = 0; i < history.length; i++)
         if (history[i].isUser)
@@ -235,7 +239,7 @@ class MessagingController {
           {
             'role': 'assistant',
             'content':
-                '[${_notifier.currentState.getRoleById(history[i].roleId)?.name ?? history[i].roleId}]: ${history[i].content}',
+                '[${rolesById[history[i].roleId]?.name ?? history[i].roleId}]: ${history[i].content}',
           },
     ];
   }
@@ -31,6 +31,7 @@ class ChatListScreen extends ConsumerWidget {
     // 用启动时一次性预加载的会话摘要——避免迭代 state.messages 全表。
     final summaries = appState.conversationSummaries;
 
+    final rolesById = appState.rolesById;
     final groupItems = <_GroupChatItem>[];
     for (final group in appState.groups) {
       final summary =
@@ -40,7 +41,7 @@ class ChatListScreen extends ConsumerWidget {
         lastMessage: summary?.lastContent ?? '群聊已创建',
         lastTime: summary?.lastTimestamp ?? 0,
         roles: group.roleIds
-            .map((id) => appState.getRoleById(id))
+            .map((id) => rolesById[id])
             .whereType<Role>()
             .toList(),
       ));
@@ -39,6 +39,9 @@ const _currencies = <String, String>{
 };
 
 class _ExchangeScreenState extends ConsumerState<ExchangeScreen> {
+  // 金额输入框只放行数字与小数点。
+  static final _amountChars = RegExp(r'[0-9.]');
+
   String _from = 'USD';
   String _to = 'CNY';
   final _amountCtrl = TextEditingController(text: '100');
@@ -161,14 +164,12 @@ class _ExchangeScreenState extends ConsumerState<ExchangeScreen> {
     });
     final now = DateTime.now();
     final start = now.subtract(Duration(days: _trendDays));
-    String fmt(DateTime d) =>
-        '${d.year}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}';
     try {
       final raw = await _callTool('get_exchange_trend', {
         'from_currency': _from,
         'to_currency': _to,
-        'start_date': fmt(start),
-        'end_date': fmt(now),
+        'start_date': fmtDate(start),
+        'end_date': fmtDate(now),
       });
       final json = jsonDecode(raw) as Map<String, dynamic>;
       final points = (json['points'] as List)
@@ -305,7 +306,7 @@ class _ExchangeScreenState extends ConsumerState<ExchangeScreen> {
             keyboardType:
             const TextInputType.numberWithOptions(decimal: true),
             inputFormatters: [
-              FilteringTextInputFormatter.allow(RegExp(r'[0-9.]')),
+              FilteringTextInputFormatter.allow(_amountChars),
             ],
             style: theme.textTheme.titleLarge
                 ?.copyWith(fontWeight: FontWeight.w700),
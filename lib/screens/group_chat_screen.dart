@@ -172,10 +172,9 @@ class _GroupChatScreenState extends ConsumerState<GroupChatScreen>
 
     // Get current group (may have been updated)
     final group = appState.getGroupById(widget.group.id) ?? widget.group;
-    final roles = group.roleIds
-        .map((id) => appState.getRoleById(id))
-        .whereType<Role>()
-        .toList();
+    final rolesById = appState.rolesById;
+    final roles =
+        group.roleIds.map((id) => rolesById[id]).whereType<Role>().toList();
 
     // 新消息进来才滚到底；用户回看历史时不打扰。
     ref.listen<int>(
@@ -257,7 +256,7 @@ class _GroupChatScreenState extends ConsumerState<GroupChatScreen>
               // 用户气泡取群里任一成员占位；角色气泡按发言人 roleId 解析。
               roleForMessage: (msg) => msg.isUser
                   ? (roles.isNotEmpty ? roles.first : null)
-                  : appState.getRoleById(msg.roleId),
+                  : rolesById[msg.roleId],
               emptyState: _buildEmptyState(theme, roles),
               selectionMode: selectionMode,
               selectedIds: selectedIds,
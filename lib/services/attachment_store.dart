@@ -7,13 +7,22 @@ import 'package:path_provider/path_provider.dart';
 /// 外部选取的文件**必须拷进应用文档目录**再引用：相册/下载目录的原件随时
 /// 可能被系统或用户清掉，而 picker 返回的缓存路径在重启后失效。
 class AttachmentStore {
-  static Future<Directory> _dir() async {
-    final docs = await getApplicationDocumentsDirectory();
-    final dir = Directory(p.join(docs.path, 'attachments'));
-    if (!await dir.exists()) {
+  /// 附件目录只需定位 + 建一次，进程内缓存；失败不缓存，下次调用重试。
+  static Future<Directory>? _dirFuture;
+
+  static Future<Directory> _dir() => _dirFuture ??= _createDir();
+
+  static Future<Directory> _createDir() async {
+    try {
+      final docs = await getApplicationDocumentsDirectory();
+      final dir = Directory(p.join(docs.path, 'attachments'));
+      // recursive create 对已存在的目录是 no-op，不必先 exists() 探一次。
       await dir.create(recursive: true);
+      return dir;
+    } catch (_) {
+      _dirFuture = null;
+      rethrow;
     }
-    return dir;
   }
 
   /// 拷贝进库，返回私有副本。时间戳前缀防同名覆盖。
@@ -26,10 +35,12 @@ class AttachmentStore {
   }
 
   /// 删除私有副本（消息删除时调用）。文件不存在视为已清理，静默成功。
+  /// 直接删、按异常判缺失，不先 exists() 多一次 stat。
   static Future<void> delete(String path) async {
-    final f = File(path);
-    if (await f.exists()) {
-      await f.delete();
+    try {
+      await File(path).delete();
+    } on PathNotFoundException {
+      // 已被清理——视为成功。
     }
   }
 }
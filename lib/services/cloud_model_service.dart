@@ -40,7 +40,8 @@ class CloudModelService extends ModelService {
         'anthropic-version': _apiVersion,
         'content-type': 'application/json',
       },
-    ));
+    ))
+      ..httpClientAdapter = ModelService.sharedHttpAdapter;
   }
 
   @override
@@ -43,7 +43,8 @@ class GeminiService extends ModelService {
           'x-goog-api-key': apiKey,
         'content-type': 'application/json',
       },
-    ));
+    ))
+      ..httpClientAdapter = ModelService.sharedHttpAdapter;
   }
 
   @override
@@ -270,10 +271,11 @@ class GeminiService extends ModelService {
     };
   }
 
+  static final _syntheticIdMarker = RegExp(r'^gemini-call-\d+-');
+
   static String _nameFromSyntheticId(String id) {
     // `gemini-call-{index}-{name}` → name.
-    final marker = RegExp(r'^gemini-call-\d+-');
-    final m = marker.firstMatch(id);
+    final m = _syntheticIdMarker.firstMatch(id);
     return m == null ? id : id.substring(m.end);
   }
 
@@ -1,3 +1,4 @@
+import 'package:dio/dio.dart';
 import 'agent.dart';
 
 abstract class ModelService {
@@ -5,6 +6,11 @@ abstract class ModelService {
 
   ModelService(this.host);
 
+  /// 各 service 的 Dio 共用的底层 HTTP 适配器——也就是同一个连接池。配置变化
+  /// 会重建 service 实例，模型列表拉取也会临时组装 service；共用适配器后，对同
+  /// 一 host 的 TLS 连接在这些实例之间复用，不随实例丢弃。
+  static final HttpClientAdapter sharedHttpAdapter = HttpClientAdapter();
+
   /// 关闭思考的统一指令——以 system prompt 形式注入。`think:false` 这类引擎私
   /// 有字段只是语法糖，唯一可靠的控制点是喂给模型的 token，所以直接写进 prompt
   /// 在任何引擎/协议下都成立。
@@ -41,8 +47,11 @@ abstract class ModelService {
     r'<(think|thinking|analysis|reasoning)\b[^>]*>[\s\S]*?</\1>',
     caseSensitive: false,
   );
-  static String stripThinking(String text) =>
-      text.replaceAll(_thinkBlockPattern, '').trim();
+  static String stripThinking(String text) {
+    // 绝大多数回复根本没有闭合标签——先做一次子串探测，命中才跑正则。
+    if (!text.contains('</')) return text.trim();
+    return text.replaceAll(_thinkBlockPattern, '').trim();
+  }
 
   Future<List<String>> fetchModels();
 
@@ -22,7 +22,8 @@ class OllamaService extends ModelService {
       baseUrl: host,
       connectTimeout: const Duration(seconds: 10),
       receiveTimeout: const Duration(seconds: 120),
-    ));
+    ))
+      ..httpClientAdapter = ModelService.sharedHttpAdapter;
   }
 
   /// 协议级支持。具体某个模型能不能跑 tools 看 [modelSupportsTools]。
@@ -30,7 +30,8 @@ abstract class OpenAICompatibleService extends ModelService {
         'Authorization': 'Bearer ${gatewayToken ?? apiKey}',
         'content-type': 'application/json',
       },
-    ));
+    ))
+      ..httpClientAdapter = ModelService.sharedHttpAdapter;
   }
 
   /// 网络获取失败 / key 为空时的兜底模型列表——用户至少能选到一个。
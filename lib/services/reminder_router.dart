@@ -163,6 +163,8 @@ $candidateLines
     return _parseSingleId(result);
   }
 
+  static final _identifierPattern = RegExp(r'[a-zA-Z_][a-zA-Z0-9_]*');
+
   /// 容错解析：模型可能返回 `"work"` / `work` / `{"role":"work"}` 等多种形态。
   /// 取出现的第一个非空字符串 id。
   static String? _parseSingleId(String text) {
@@ -184,7 +186,7 @@ $candidateLines
       }
     } catch (_) {/* fall through */}
     // 兜底：取第一个英文/数字标识符
-    final match = RegExp(r'[a-zA-Z_][a-zA-Z0-9_]*').firstMatch(trimmed);
+    final match = _identifierPattern.firstMatch(trimmed);
     return match?.group(0);
   }
 }
@@ -14,6 +14,25 @@ String? encodeChartData(List<String>? cards) {
   return '[${cards.join(',')}]';
 }
 
+/// 解码结果缓存上限——只需盖住一屏内的图表消息，超出按插入顺序淘汰最早的。
+const _kChartJsonCacheSize = 64;
+final _chartJsonCache = <String, Object?>{};
+
+/// 解码卡片 JSON（单张 `{type,data}` 或 `chartData` 数组串），解析失败返回 null。
+/// 气泡每次重建都会走到这里，而消息内容落库后不再变——按原串缓存解码结果，同一
+/// 条消息只解析一次。返回值是共享的，调用方只读不改。
+Object? decodeChartJson(String raw) {
+  if (_chartJsonCache.containsKey(raw)) return _chartJsonCache[raw];
+  Object? decoded;
+  try {
+    decoded = jsonDecode(raw);
+  } catch (_) {}
+  if (_chartJsonCache.length >= _kChartJsonCacheSize) {
+    _chartJsonCache.remove(_chartJsonCache.keys.first);
+  }
+  return _chartJsonCache[raw] = decoded;
+}
+
 /// 工具名 → 卡片类型；不可视化的工具返回 null。
 String? chartCardTypeForTool(String toolName) {
   switch (toolName) {
@@ -3,18 +3,21 @@ library;
 
 const _weekdays = ['一', '二', '三', '四', '五', '六', '日'];
 
+/// `00`…`59` 预生成表——月/日/时/分/时区偏移都落在此区间。聊天列表、气泡
+/// tooltip 每条消息都要格式化，查表免去逐字段 `toString().padLeft` 的临时串。
+final _twoDigits =
+    List<String>.generate(60, (i) => i < 10 ? '0$i' : '$i', growable: false);
+
 /// `YYYY-MM-DD`。
 String fmtDate(DateTime d) =>
-    '${d.year}-${d.month.toString().padLeft(2, '0')}-'
-    '${d.day.toString().padLeft(2, '0')}';
+    '${d.year}-${_twoDigits[d.month]}-${_twoDigits[d.day]}';
 
 /// 周中文：`周一`/`周二`/…/`周日`。
 String fmtWeekday(DateTime d) => '周${_weekdays[d.weekday - 1]}';
 
 /// `HH:mm`。
 String fmtHourMinute(DateTime d) =>
-    '${d.hour.toString().padLeft(2, '0')}:'
-    '${d.minute.toString().padLeft(2, '0')}';
+    '${_twoDigits[d.hour]}:${_twoDigits[d.minute]}';
 
 /// `YYYY-MM-DD 周X HH:mm`，用于消息 tooltip。
 String fmtMessageStamp(DateTime d) =>
@@ -25,13 +28,15 @@ const _monthAbbr = <String, int>{
   'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
 };
 
+final _rfc1123Pattern = RegExp(
+  r'(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})\s+(\d{2}):(\d{2}):(\d{2})\s*([+-]\d{4}|GMT|UTC)?',
+);
+
 /// 解析 RFC-1123 / HTTP 日期串（如 `Tue, 16 Jun 2026 00:02:31 +0000`、
 /// 末尾也可为 `GMT`/`UTC`），返回**UTC** [DateTime]；无法解析返回 null。
 /// 外部 API（汇率等）的 `updated_at` 常是这种格式，客户端需转本地时区再展示。
 DateTime? parseRfc1123(String s) {
-  final m = RegExp(
-    r'(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})\s+(\d{2}):(\d{2}):(\d{2})\s*([+-]\d{4}|GMT|UTC)?',
-  ).firstMatch(s.trim());
+  final m = _rfc1123Pattern.firstMatch(s.trim());
   if (m == null) return null;
   final month = _monthAbbr[m.group(2)!];
   if (month == null) return null;
@@ -78,8 +83,8 @@ String fmtSystemTimestamp(DateTime now) {
   final tz = now.timeZoneName;
   final offset = now.timeZoneOffset;
   final sign = offset.isNegative ? '-' : '+';
-  final hOff = offset.inHours.abs().toString().padLeft(2, '0');
-  final mOff = (offset.inMinutes.abs() % 60).toString().padLeft(2, '0');
+  final hOff = _twoDigits[offset.inHours.abs()];
+  final mOff = _twoDigits[offset.inMinutes.abs() % 60];
   return '${fmtDate(now)} ${fmtWeekday(now)} ${fmtHourMinute(now)} '
       '$tz UTC$sign$hOff:$mOff';
 }
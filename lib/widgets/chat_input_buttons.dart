@@ -13,14 +13,15 @@ class AttachmentButton extends ConsumerWidget {
   final String? groupId;
   const AttachmentButton({super.key, this.groupId});
 
-  Future<void> _send(
-      WidgetRef ref, String type, String path, String name) async {
+  Future<void> _send(WidgetRef ref, String type, String path, String name,
+      {int? size}) async {
     try {
       await ref.read(appStateProvider.notifier).sendAttachment(
             type: type,
             sourcePath: path,
             name: name,
             groupId: groupId,
+            size: size,
           );
     } catch (_) {
       showAppToast('附件发送失败，请重试', icon: Icons.error_outline);
@@ -49,7 +50,8 @@ class AttachmentButton extends ConsumerWidget {
     final result = await FilePicker.pickFiles();
     final f = result?.files.firstOrNull;
     if (f == null || f.path == null) return;
-    await _send(ref, 'file', f.path!, f.name);
+    // file_picker 已带回字节数；image_picker 的 XFile 没有，交给下游读副本。
+    await _send(ref, 'file', f.path!, f.name, size: f.size);
   }
 
   @override
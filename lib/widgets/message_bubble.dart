@@ -1,4 +1,3 @@
-import 'dart:convert';
 import 'dart:math' as math;
 import 'package:flutter/material.dart';
 import 'package:flutter/services.dart';
@@ -8,6 +7,7 @@ import '../models/message.dart';
 import '../models/role.dart';
 import '../services/tts_service.dart';
 import '../theme/design_tokens.dart';
+import '../utils/chart_cards.dart';
 import '../utils/color_hex.dart';
 import '../utils/time_format.dart';
 import 'attachment_bubble.dart';
@@ -404,12 +404,8 @@ class _ChartCard extends StatelessWidget {
 
   @override
   Widget build(BuildContext context) {
-    Map<String, dynamic>? decoded;
-    try {
-      final d = jsonDecode(message.content);
-      if (d is Map) decoded = d.cast<String, dynamic>();
-    } catch (_) {}
-    final body = decoded == null ? null : _chartBodyFor(decoded);
+    final d = decodeChartJson(message.content);
+    final body = d is Map ? _chartBodyFor(d.cast<String, dynamic>()) : null;
     if (body == null) return const SizedBox.shrink();
 
     final theme = Theme.of(context);
@@ -470,14 +466,8 @@ class _ChartCard extends StatelessWidget {
 /// 列表，挂在文字消息上方同气泡渲染。失败 / 为空 → 空列表。
 List<Widget> _buildAttachedCharts(BuildContext context, String? chartData) {
   if (chartData == null || chartData.isEmpty) return const [];
-  List<dynamic> list;
-  try {
-    final d = jsonDecode(chartData);
-    if (d is! List) return const [];
-    list = d;
-  } catch (_) {
-    return const [];
-  }
+  final list = decodeChartJson(chartData);
+  if (list is! List) return const [];
   final scheme = Theme.of(context).colorScheme;
   final out = <Widget>[];
   for (final c in list) {